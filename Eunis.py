@@ -66,6 +66,9 @@ class USCustomsDutyAnalysis:
             '2024': {'description': 'Renewed Focus on Strategic Goods', 'avg_duty_change': 0.3},
             '2025': {'description': 'Projected Policy Stability', 'avg_duty_change': 0.0}
         }
+        
+        # Gabarits de figures réutilisés d'un rapport à l'autre (clé -> artistes)
+        self._figure_templates = {}
     
     def get_country_duty_data(self, country):
         """
@@ -497,62 +500,42 @@ class USCustomsDutyAnalysis:
         print(f"   Minimum: {duty_trend['Duties Collected (M$)'].min():.0f} M$ ({duty_trend['Duties Collected (M$)'].idxmin()})")
         print(f"   Moyenne (2002-2025): {duty_trend['Duties Collected (M$)'].mean():.0f} M$")
         
-        # Visualisation pour le pays spécifique
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
+        # Visualisation pour le pays spécifique (gabarit réutilisé, seules les données changent)
+        template = self._get_figure_template('country_report', self._build_country_report_template)
+        fig = template['fig']
+        ax1, ax1_twin, ax2, ax4 = template['ax1'], template['ax1_twin'], template['ax2'], template['ax4']
         
         # 1. Droits de douane et volume commercial
-        ax1.plot(country_data['Year'], country_data['Duties Collected (M$)'], 
-                label='Droits de Douane', linewidth=2, color='blue')
-        ax1_twin = ax1.twinx()
-        ax1_twin.plot(country_data['Year'], country_data['Trade Volume (M$)'], 
-                     label='Volume Commercial', linewidth=2, color='green', linestyle='--')
+        template['duties_line'].set_data(country_data['Year'], country_data['Duties Collected (M$)'])
+        template['trade_line'].set_data(country_data['Year'], country_data['Trade Volume (M$)'])
         ax1.set_title(f'Évolution des Droits de Douane et du Volume Commercial ({country_name})', fontsize=12, fontweight='bold')
-        ax1.set_ylabel('Droits de Douane (M$)', color='blue')
-        ax1_twin.set_ylabel('Volume Commercial (M$)', color='green')
-        ax1.legend(loc='upper left')
-        ax1_twin.legend(loc='upper right')
-        ax1.grid(True, alpha=0.3)
         
         # 2. Ratio Droits/Commerce et taux effectif
-        ax2.plot(country_data['Year'], country_data['Duties/Trade Ratio (%)'], 
-                label='Ratio Droits/Commerce', linewidth=2, color='red')
-        ax2.plot(country_data['Year'], country_data['Effective Duty Rate (%)'], 
-                label='Taux Effectif', linewidth=2, color='purple')
+        template['ratio_line'].set_data(country_data['Year'], country_data['Duties/Trade Ratio (%)'])
+        template['rate_line'].set_data(country_data['Year'], country_data['Effective Duty Rate (%)'])
         ax2.set_title(f'Ratios Douaniers ({country_name})', fontsize=12, fontweight='bold')
-        ax2.set_ylabel('Ratio (%)')
-        ax2.legend()
-        ax2.grid(True, alpha=0.3)
         
-        # 3. Impact des événements politiques
-        policy_impact = []
-        years = []
-        for year, event in self.trade_policy_events.items():
-            if int(year) >= 2002 and int(year) <= 2025:
-                policy_impact.append(event['avg_duty_change'])
-                years.append(int(year))
+        for ax in (ax1, ax1_twin, ax2):
+            ax.relim()
+            ax.autoscale_view()
         
-        ax3.bar(years, policy_impact, alpha=0.7)
-        ax3.set_title(f'Impact des Politiques Commerciales sur les Droits de Douane', fontsize=12, fontweight='bold')
-        ax3.set_ylabel('Changement de Taux (%)')
-        ax3.grid(True, alpha=0.3)
+        # 3. Impact des événements politiques : identique pour tous les pays, tracé dans le gabarit
         
         # 4. Comparaison avec d'autres pays de la région
         region_countries = df[(df['Region'] == region) & (df['Year'] == latest_year)]
         region_countries = region_countries.nlargest(5, 'Duties Collected (M$)')
         
-        bars = ax4.bar(region_countries['Country'], region_countries['Duties Collected (M$)'])
+        self._update_bars(ax4, template['region_bars'], template['region_labels'],
+                          region_countries['Country'].tolist(),
+                          region_countries['Duties Collected (M$)'].tolist(), '{:.0f} M$')
         ax4.set_title(f'Comparaison Régionale des Droits de Douane ({latest_year})', fontsize=12, fontweight='bold')
-        ax4.set_ylabel('Droits de Douane (M$)')
-        ax4.tick_params(axis='x', rotation=45)
         
-        # Ajouter les valeurs sur les barres
-        for bar in bars:
-            height = bar.get_height()
-            ax4.text(bar.get_x() + bar.get_width()/2., height + 10,
-                    f'{height:.0f} M$', ha='center', va='bottom')
+        # Mise en page calculée une seule fois, au premier rendu (largeur réelle des graduations)
+        if not template['laid_out']:
+            fig.tight_layout()
+            template['laid_out'] = True
         
-        plt.tight_layout()
-        plt.savefig(f'{country_name}_customs_duty_analysis_2002_2025.png', dpi=300, bbox_inches='tight')
+        fig.savefig(f'{country_name}_customs_duty_analysis_2002_2025.png', dpi=300, bbox_inches='tight')
         plt.show()
     
     def create_comparative_analysis(self, df, country_list):
@@ -580,29 +563,28 @@ class USCustomsDutyAnalysis:
                   f"{row['Effective Duty Rate (%)']:<10.1f} {row['Duties/Trade Ratio (%)']:<10.1f} "
                   f"{row['Region']:<15}")
         
-        # Visualisation comparative
-        fig, axes = plt.subplots(2, 3, figsize=(18, 12))
-        axes = axes.flatten()
+        # Visualisation comparative (gabarit réutilisé pour un même nombre de pays)
+        template = self._get_figure_template(
+            ('comparative', len(country_list)),
+            lambda: self._build_comparative_template(len(country_list)))
+        fig = template['fig']
+        axes = template['axes']
         
         indicators = ['Duties Collected (M$)', 'Trade Volume (M$)', 'Effective Duty Rate (%)', 
                      'Duties/Trade Ratio (%)']
-        titles = ['Droits de Douane (M$)', 'Volume Commercial (M$)', 'Taux Effectif (%)', 
-                 'Ratio Droits/Commerce (%)']
-        
-        colors = plt.cm.Set3(np.linspace(0, 1, len(country_list)))
         
-        for i, (indicator, title) in enumerate(zip(indicators, titles)):
+        for i, indicator in enumerate(indicators):
             ax = axes[i]
             for j, country in enumerate(country_list):
                 country_yearly = comparative_data[comparative_data['Country'] == country]
-                ax.plot(country_yearly['Year'], country_yearly[indicator], 
-                       label=country, color=colors[j], linewidth=2)
-            
-            ax.set_title(title, fontsize=11, fontweight='bold')
-            ax.grid(True, alpha=0.3)
-            
-            if i == 0:
-                ax.legend(loc='upper left', bbox_to_anchor=(1, 1))
+                line = template['lines'][i][j]
+                line.set_data(country_yearly['Year'], country_yearly[indicator])
+                line.set_label(country)
+            ax.relim()
+            ax.autoscale_view()
+        
+        for text, country in zip(template['legend'].get_texts(), country_list):
+            text.set_text(country)
         
         # 5. Diagramme à barres comparatif pour la dernière année
         ax5 = axes[4]
@@ -612,27 +594,137 @@ class USCustomsDutyAnalysis:
             if not country_data.empty:
                 latest_duties.append(country_data['Duties Collected (M$)'].values[0])
         
-        bars = ax5.bar(country_list, latest_duties)
+        self._update_bars(ax5, template['bars'], template['bar_labels'],
+                          country_list, latest_duties, '{:.0f}')
         ax5.set_title(f'Droits de Douane par Pays ({latest_year})', fontsize=11, fontweight='bold')
-        ax5.set_ylabel('Droits de Douane (M$)')
-        ax5.tick_params(axis='x', rotation=45)
-        
-        # Ajouter les valeurs sur les barres
-        for bar in bars:
-            height = bar.get_height()
-            ax5.text(bar.get_x() + bar.get_width()/2., height + 10,
-                    f'{height:.0f}', ha='center', va='bottom')
         
         # 6. Diagramme en camembert des parts des droits de douane
+        # (les secteurs et leurs étiquettes dépendent des parts : seul cet axe est retracé)
         ax6 = axes[5]
+        ax6.clear()
         total_duties = latest_data['Duties Collected (M$)'].sum()
         duty_shares = [duty / total_duties * 100 for duty in latest_duties]
         ax6.pie(duty_shares, labels=country_list, autopct='%1.1f%%')
         ax6.set_title(f'Part des Droits de Douane par Pays ({latest_year})', fontsize=11, fontweight='bold')
         
-        plt.tight_layout()
-        plt.savefig('comparative_customs_duty_analysis.png', dpi=300, bbox_inches='tight')
+        # Mise en page calculée une seule fois, au premier rendu (largeur réelle des graduations)
+        if not template['laid_out']:
+            fig.tight_layout()
+            template['laid_out'] = True
+        
+        fig.savefig('comparative_customs_duty_analysis.png', dpi=300, bbox_inches='tight')
         plt.show()
+    
+    def _get_figure_template(self, key, builder):
+        """Renvoie le gabarit de figure associé à la clé, en le construisant si nécessaire"""
+        template = self._figure_templates.get(key)
+        # Une figure fermée (ex: fenêtre fermée après plt.show()) ne peut pas être réutilisée
+        if template is None or not plt.fignum_exists(template['fig'].number):
+            template = builder()
+            self._figure_templates[key] = template
+        return template
+    
+    def _build_country_report_template(self):
+        """Construit une seule fois la mise en page du rapport par pays"""
+        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(15, 12))
+        
+        # 1. Droits de douane et volume commercial
+        duties_line, = ax1.plot([], [], label='Droits de Douane', linewidth=2, color='blue')
+        ax1_twin = ax1.twinx()
+        trade_line, = ax1_twin.plot([], [], label='Volume Commercial', linewidth=2, color='green', linestyle='--')
+        ax1.set_title('Évolution des Droits de Douane et du Volume Commercial', fontsize=12, fontweight='bold')
+        ax1.set_ylabel('Droits de Douane (M$)', color='blue')
+        ax1_twin.set_ylabel('Volume Commercial (M$)', color='green')
+        ax1.legend(loc='upper left')
+        ax1_twin.legend(loc='upper right')
+        ax1.grid(True, alpha=0.3)
+        
+        # 2. Ratio Droits/Commerce et taux effectif
+        ratio_line, = ax2.plot([], [], label='Ratio Droits/Commerce', linewidth=2, color='red')
+        rate_line, = ax2.plot([], [], label='Taux Effectif', linewidth=2, color='purple')
+        ax2.set_title('Ratios Douaniers', fontsize=12, fontweight='bold')
+        ax2.set_ylabel('Ratio (%)')
+        ax2.legend()
+        ax2.grid(True, alpha=0.3)
+        
+        # 3. Impact des événements politiques
+        policy_impact = []
+        years = []
+        for year, event in self.trade_policy_events.items():
+            if int(year) >= 2002 and int(year) <= 2025:
+                policy_impact.append(event['avg_duty_change'])
+                years.append(int(year))
+        
+        ax3.bar(years, policy_impact, alpha=0.7)
+        ax3.set_title(f'Impact des Politiques Commerciales sur les Droits de Douane', fontsize=12, fontweight='bold')
+        ax3.set_ylabel('Changement de Taux (%)')
+        ax3.grid(True, alpha=0.3)
+        
+        # 4. Comparaison avec d'autres pays de la région (5 pays au maximum)
+        region_bars = ax4.bar(range(5), [0] * 5)
+        region_labels = [ax4.text(0, 0, '', ha='center', va='bottom') for _ in region_bars]
+        ax4.set_title('Comparaison Régionale des Droits de Douane', fontsize=12, fontweight='bold')
+        ax4.set_ylabel('Droits de Douane (M$)')
+        ax4.tick_params(axis='x', rotation=45)
+        
+        return {
+            'fig': fig, 'ax1': ax1, 'ax1_twin': ax1_twin, 'ax2': ax2, 'ax4': ax4,
+            'duties_line': duties_line, 'trade_line': trade_line,
+            'ratio_line': ratio_line, 'rate_line': rate_line,
+            'region_bars': region_bars, 'region_labels': region_labels,
+            'laid_out': False
+        }
+    
+    def _build_comparative_template(self, n_countries):
+        """Construit une seule fois la mise en page de l'analyse comparative pour n pays"""
+        fig, axes = plt.subplots(2, 3, figsize=(18, 12))
+        axes = axes.flatten()
+        
+        titles = ['Droits de Douane (M$)', 'Volume Commercial (M$)', 'Taux Effectif (%)', 
+                 'Ratio Droits/Commerce (%)']
+        
+        colors = plt.cm.Set3(np.linspace(0, 1, n_countries))
+        
+        lines = []
+        legend = None
+        for i, title in enumerate(titles):
+            ax = axes[i]
+            lines.append([ax.plot([], [], label=' ', color=colors[j], linewidth=2)[0]
+                          for j in range(n_countries)])
+            
+            ax.set_title(title, fontsize=11, fontweight='bold')
+            ax.grid(True, alpha=0.3)
+            
+            if i == 0:
+                legend = ax.legend(loc='upper left', bbox_to_anchor=(1, 1))
+        
+        # 5. Diagramme à barres comparatif pour la dernière année
+        ax5 = axes[4]
+        bars = ax5.bar(range(n_countries), [0] * n_countries)
+        bar_labels = [ax5.text(0, 0, '', ha='center', va='bottom') for _ in bars]
+        ax5.set_ylabel('Droits de Douane (M$)')
+        ax5.tick_params(axis='x', rotation=45)
+        
+        return {'fig': fig, 'axes': axes, 'lines': lines, 'legend': legend,
+                'bars': bars, 'bar_labels': bar_labels, 'laid_out': False}
+    
+    def _update_bars(self, ax, bars, labels, names, values, label_format):
+        """Met à jour la hauteur, les étiquettes et les valeurs d'un diagramme à barres existant"""
+        for k, (bar, text) in enumerate(zip(bars, labels)):
+            visible = k < len(values)
+            bar.set_visible(visible)
+            text.set_visible(visible)
+            if visible:
+                height = values[k]
+                bar.set_height(height)
+                text.set_position((bar.get_x() + bar.get_width()/2., height + 10))
+                text.set_text(label_format.format(height))
+        
+        ax.set_xticks(range(len(names)))
+        ax.set_xticklabels(names)
+        ax.set_xlim(-0.5, max(len(names), 1) - 0.5)
+        ax.relim(visible_only=True)
+        ax.autoscale_view(scalex=False)
 
 # Fonction principale
 def main():